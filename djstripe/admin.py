@@ -3,7 +3,7 @@ Django Administration interface definitions
 """
 from django.contrib import admin
 
-from . import models
+from . import enums, models
 
 
 class ReadOnlyMixin:
@@ -57,12 +57,10 @@ class BaseHasSourceListFilter(admin.SimpleListFilter):
         source:
         https://docs.djangoproject.com/en/1.10/ref/contrib/admin/#django.contrib.admin.ModelAdmin.list_filter
         """
-        filter_args = {self._filter_arg_key: None}
-
         if self.value() == "yes":
-            return queryset.exclude(**filter_args)
+            return queryset.filter(**{self._filter_arg_key + "__isnull": False})
         if self.value() == "no":
-            return queryset.filter(**filter_args)
+            return queryset.filter(**{self._filter_arg_key + "__isnull": True})
 
 
 class CustomerHasSourceListFilter(BaseHasSourceListFilter):
@@ -78,6 +76,9 @@ class CustomerSubscriptionStatusListFilter(admin.SimpleListFilter):
 
     title = "subscription status"
     parameter_name = "sub_status"
+    # Subscription statuses are a fixed set, so offer all of them rather
+    # than scanning the subscriptions table for the ones currently in use.
+    status_lookups = enums.SubscriptionStatus.choices + (("none", "No Subscription"),)
 
     def lookups(self, request, model_admin):
         """
@@ -90,14 +91,7 @@ class CustomerSubscriptionStatusListFilter(admin.SimpleListFilter):
         source:
         https://docs.djangoproject.com/en/1.10/ref/contrib/admin/#django.contrib.admin.ModelAdmin.list_filter
         """
-        statuses = [
-            [x, x.replace("_", " ").title()]
-            for x in models.Subscription.objects.values_list(
-                "status", flat=True
-            ).distinct()
-        ]
-        statuses.append(["none", "No Subscription"])
-        return statuses
+        return self.status_lookups
 
     def queryset(self, request, queryset):
         """
@@ -108,8 +102,19 @@ class CustomerSubscriptionStatusListFilter(admin.SimpleListFilter):
         """
         if self.value() is None:
             return queryset.all()
-        else:
-            return queryset.filter(subscriptions__status=self.value()).distinct()
+
+        # Filter on a subquery rather than joining subscriptions, which would
+        # need a DISTINCT over every customer column to dedupe the rows.
+        # Subscription.customer points at DJSTRIPE_FOREIGN_KEY_TO_FIELD, which
+        # isn't necessarily the customer's primary key.
+        customer_field = models.Subscription._meta.get_field("customer")
+        lookup = customer_field.target_field.attname + "__in"
+        subscriptions = models.Subscription.objects.all()
+        if self.value() == "none":
+            return queryset.exclude(**{lookup: subscriptions.values("customer")})
+        return queryset.filter(
+            **{lookup: subscriptions.filter(status=self.value()).values("customer")}
+        )
 
 
 @admin.register(models.IdempotencyKey)
@@ -132,6 +137,7 @@ class WebhookEventTriggerAdmin(ReadOnlyMixin, admin.ModelAdmin):
     )
     list_filter = ("created", "valid", "processed")
     list_select_related = ("event",)
+    show_full_result_count = False
     raw_id_fields = get_forward_relation_fields_for_model(models.WebhookEventTrigger)
 
     def reprocess(self, request, queryset):
@@ -185,6 +191,13 @@ class SubscriptionInline(admin.StackedInline):
     raw_id_fields = get_forward_relation_fields_for_model(model)
     show_change_link = True
 
+    def get_queryset(self, request):
+        # Each stacked form is titled with Subscription.__str__(),
+        # which renders both the customer and the plan.
+        return (
+            super().get_queryset(request).select_related("customer__subscriber", "plan")
+        )
+
 
 class TaxIdInline(admin.TabularInline):
     """A TabularInline for use models.Subscription."""
@@ -234,6 +247,7 @@ class AccountAdmin(StripeModelAdmin):
 class APIKeyAdmin(StripeModelAdmin):
     list_display = ("type", "djstripe_owner_account")
     list_filter = ("type",)
+    list_select_related = ("djstripe_owner_account",)
     search_fields = ("name",)
 
     get_fieldsets = admin.ModelAdmin.get_fieldsets
@@ -281,6 +295,7 @@ class ChargeAdmin(StripeModelAdmin):
     )
     search_fields = ("customer__id", "invoice__id")
     list_filter = ("status", "paid", "refunded", "captured")
+    show_full_result_count = False
 
 
 @admin.register(models.Coupon)
@@ -325,6 +340,7 @@ class EventAdmin(ReadOnlyMixin, StripeModelAdmin):
     list_display = ("type", "request_id")
     list_filter = ("type", "created")
     search_fields = ("request_id",)
+    show_full_result_count = False
 
 
 @admin.register(models.FileUpload)
@@ -364,6 +380,7 @@ class SetupIntentAdmin(StripeModelAdmin):
     list_select_related = (
         "customer",
         "customer__subscriber",
+        "on_behalf_of",
         "payment_method",
     )
     search_fields = ("customer__id", "status")
@@ -382,25 +399,28 @@ class InvoiceAdmin(StripeModelAdmin):
     )
     list_select_related = ("customer", "customer__subscriber")
     search_fields = ("customer__id", "number", "receipt_number")
+    show_full_result_count = False
     inlines = (InvoiceItemInline,)
 
 
 @admin.register(models.Plan)
 class PlanAdmin(StripeModelAdmin):
     radio_fields = {"interval": admin.HORIZONTAL}
+    # Fields Stripe doesn't allow to be changed once the plan exists
+    change_readonly_fields = (
+        "amount",
+        "currency",
+        "interval",
+        "interval_count",
+        "trial_period_days",
+    )
 
     def get_readonly_fields(self, request, obj=None):
         """Return extra readonly_fields."""
         readonly_fields = super().get_readonly_fields(request, obj)
 
         if obj:
-            readonly_fields += (
-                "amount",
-                "currency",
-                "interval",
-                "interval_count",
-                "trial_period_days",
-            )
+            readonly_fields += self.change_readonly_fields
 
         return readonly_fields
 
@@ -409,6 +429,7 @@ class PlanAdmin(StripeModelAdmin):
 class PriceAdmin(StripeModelAdmin):
     list_display = ("product", "currency", "active")
     list_filter = ("active", "type", "billing_scheme", "tiers_mode")
+    list_select_related = ("product",)
     raw_id_fields = ("product",)
     search_fields = ("nickname",)
     radio_fields = {"type": admin.HORIZONTAL}
@@ -432,6 +453,7 @@ class RefundAdmin(StripeModelAdmin):
         "failure_reason",
     )
     list_filter = ("reason", "status")
+    list_select_related = ("charge",)
     search_fields = ("receipt_number",)
 
 
@@ -454,13 +476,21 @@ class PaymentMethodAdmin(StripeModelAdmin):
 class SubscriptionAdmin(StripeModelAdmin):
     list_display = ("customer", "status")
     list_filter = ("status", "cancel_at_period_end")
-    list_select_related = ("customer", "customer__subscriber")
+    list_select_related = ("customer", "customer__subscriber", "plan")
 
     inlines = (SubscriptionItemInline,)
 
     def _cancel(self, request, queryset):
         """Cancel a subscription."""
         for subscription in queryset:
+            # Subscriptions that have already ended can't be canceled again, skip
+            # them rather than making pointless round-trips to the Stripe API.
+            if subscription.status in enums.ENDED_SUBSCRIPTION_STATUSES:
+                self.message_user(
+                    request, "Skipped ended subscription {}".format(subscription)
+                )
+                continue
+
             subscription.cancel()
 
     _cancel.short_description = "Cancel selected subscriptions"  # type: ignore # noqa
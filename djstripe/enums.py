@@ -714,6 +714,13 @@ class SubscriptionStatus(Enum):
     unpaid = _("Unpaid")
 
 
+# Subscriptions in these states have ended for good and can't be reactivated
+ENDED_SUBSCRIPTION_STATUSES = (
+    SubscriptionStatus.canceled,
+    SubscriptionStatus.incomplete_expired,
+)
+
+
 class TaxIdType(Enum):
     ae_trn = _("AE TRN")
     au_abn = _("AU ABN")
@@ -16,8 +16,8 @@ class Command(BaseCommand):
         """
         Create Customer objects for Subscribers without Customer objects associated.
         """
-        for subscriber in get_subscriber_model().objects.filter(
-            djstripe_customers=None
+        for subscriber in (
+            get_subscriber_model().objects.filter(djstripe_customers=None).iterator()
         ):
             # use get_or_create in case of race conditions on large subscriber bases
             Customer.get_or_create(subscriber=subscriber)
@@ -17,7 +17,7 @@ class Command(BaseCommand):
         qs = get_subscriber_model().objects.filter(djstripe_customers__isnull=True)
         count = 0
         total = qs.count()
-        for subscriber in qs:
+        for subscriber in qs.iterator():
             count += 1
             perc = int(round(100 * (float(count) / float(total))))
             print(
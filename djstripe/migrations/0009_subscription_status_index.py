@@ -0,0 +1,26 @@
+# Generated by Django 3.1.14 on 2026-10-15 03:57
+
+from django.db import migrations
+
+import djstripe.enums
+import djstripe.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("djstripe", "0008_auto_20201119_2218"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="subscription",
+            name="status",
+            field=djstripe.fields.StripeEnumField(
+                db_index=True,
+                enum=djstripe.enums.SubscriptionStatus,
+                help_text="The status of this subscription.",
+                max_length=18,
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 3.1.14 on 2026-10-15 03:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("djstripe", "0009_subscription_status_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="event",
+            name="type",
+            field=models.CharField(
+                db_index=True,
+                help_text="Stripe's event description code",
+                max_length=250,
+            ),
+        ),
+    ]
@@ -1417,7 +1417,9 @@ class Subscription(StripeModel):
         "might differ from the created date due to backdating.",
     )
     status = StripeEnumField(
-        enum=enums.SubscriptionStatus, help_text="The status of this subscription."
+        enum=enums.SubscriptionStatus,
+        db_index=True,
+        help_text="The status of this subscription.",
     )
     trial_end = StripeDateTimeField(
         null=True,
@@ -1088,12 +1088,7 @@ class Customer(StripeModel):
         Returns this customer's valid subscriptions
         (subscriptions that aren't canceled or incomplete_expired).
         """
-        return self.subscriptions.exclude(
-            status__in=[
-                enums.SubscriptionStatus.canceled,
-                enums.SubscriptionStatus.incomplete_expired,
-            ]
-        )
+        return self.subscriptions.exclude(status__in=enums.ENDED_SUBSCRIPTION_STATUSES)
 
     @property
     def subscription(self):
@@ -1107,15 +1102,17 @@ class Customer(StripeModel):
             In this case, use ``Customer.subscriptions`` instead.
         """
 
-        subscriptions = self.valid_subscriptions
+        # Fetch at most two rows in a single query, that's enough to tell
+        # whether the customer has more than one subscription.
+        subscriptions = list(self.valid_subscriptions[:2])
 
-        if subscriptions.count() > 1:
+        if len(subscriptions) > 1:
             raise MultipleSubscriptionException(
                 "This customer has multiple subscriptions. Use Customer.subscriptions "
                 "to access them."
             )
-        else:
-            return subscriptions.first()
+
+        return subscriptions[0] if subscriptions else None
 
     def can_charge(self):
         """Determines if this customer is able to be charged."""
@@ -1347,7 +1344,9 @@ class Event(StripeModel):
         blank=True,
     )
     idempotency_key = models.TextField(default="", blank=True)
-    type = models.CharField(max_length=250, help_text="Stripe's event description code")
+    type = models.CharField(
+        max_length=250, db_index=True, help_text="Stripe's event description code"
+    )
 
     def str_parts(self):
         return ["type={type}".format(type=self.type)] + super().str_parts()
@@ -1394,7 +1393,8 @@ class Event(StripeModel):
 
         webhooks.call_handlers(event=self)
 
-        signal = WEBHOOK_SIGNALS.get(self.type)
+        # Don't create signals for event types nobody is listening to
+        signal = WEBHOOK_SIGNALS.get_if_created(self.type)
         if signal:
             return signal.send(sender=Event, event=self)
 
@@ -1,9 +1,29 @@
 """
 dj-stripe Admin Tests.
 """
+from copy import deepcopy
+from unittest.mock import patch
+
 from django.contrib import admin
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.db import connection
+from django.test import RequestFactory, TestCase
+
+from djstripe.admin import (
+    CustomerHasSourceListFilter,
+    CustomerSubscriptionStatusListFilter,
+    InvoiceCustomerHasSourceListFilter,
+)
+from djstripe.enums import SubscriptionStatus
+from djstripe.models import Customer, DjstripePaymentMethod, Invoice, Subscription
+
+from . import (
+    FAKE_CUSTOMER,
+    FAKE_CUSTOMER_II,
+    FAKE_PLAN,
+    FAKE_PRODUCT,
+    FAKE_SUBSCRIPTION,
+)
 
 
 class TestAdminSite(TestCase):
@@ -29,3 +49,183 @@ class TestAdminSite(TestCase):
                         search_field=search_field, model_name=model_name
                     ),
                 )
+
+    def test_list_select_related(self):
+        """
+        Check that every field in list_select_related is a valid relation,
+        since Django only raises the resulting FieldError at query time.
+        """
+
+        for model, model_admin in admin.site._registry.items():
+            list_select_related = getattr(model_admin, "list_select_related", False)
+            if isinstance(list_select_related, bool):
+                continue
+
+            # Compiling the query is enough to validate the select_related fields
+            str(model.objects.select_related(*list_select_related).query)
+
+
+class ModelAdminTestCase(TestCase):
+    """
+    Base class for testing the admin of `model`, with a customer and its
+    subscription already synced.
+    """
+
+    model = None
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="pydanny", email="pydanny@gmail.com"
+        )
+        self.customer = FAKE_CUSTOMER.create_for_user(self.user)
+
+        with patch(
+            "stripe.Plan.retrieve", return_value=deepcopy(FAKE_PLAN), autospec=True
+        ), patch(
+            "stripe.Product.retrieve",
+            return_value=deepcopy(FAKE_PRODUCT),
+            autospec=True,
+        ):
+            self.subscription = Subscription.sync_from_stripe_data(
+                deepcopy(FAKE_SUBSCRIPTION)
+            )
+
+        self.model_admin = admin.site._registry[self.model]
+        self.request = RequestFactory().get("/")
+
+
+class TestCustomerAdmin(ModelAdminTestCase):
+    model = Customer
+
+    def setUp(self):
+        super().setUp()
+        self.customer_ii = FAKE_CUSTOMER_II.create_for_user(
+            get_user_model().objects.create_user(
+                username="arnold", email="arnold@example.com"
+            )
+        )
+
+    def test_subscription_inline_queryset(self):
+        self.request.user = get_user_model().objects.create_superuser(
+            username="admin", email="admin@example.com", password="admin"
+        )
+        inline = self.model_admin.get_inline_instances(self.request, self.customer)[0]
+        subscriptions = list(inline.get_queryset(self.request))
+        expected = [str(self.subscription)]
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [str(subscription) for subscription in subscriptions], expected
+            )
+
+    def test_subscription_status_list_filter_lookups(self):
+        list_filter = CustomerSubscriptionStatusListFilter(
+            self.request, {}, Customer, self.model_admin
+        )
+
+        with self.assertNumQueries(0):
+            lookups = list_filter.lookups(self.request, self.model_admin)
+
+        self.assertIn(("active", "Active"), lookups)
+        self.assertIn(("none", "No Subscription"), lookups)
+
+    def test_subscription_status_list_filter(self):
+        for value, expected in (
+            (None, [self.customer, self.customer_ii]),
+            (self.subscription.status, [self.customer]),
+            (SubscriptionStatus.unpaid, []),
+            ("none", [self.customer_ii]),
+        ):
+            params = {"sub_status": value} if value else {}
+            list_filter = CustomerSubscriptionStatusListFilter(
+                self.request, params, Customer, self.model_admin
+            )
+            self.assertCountEqual(
+                list_filter.queryset(self.request, Customer.objects.all()), expected
+            )
+
+    def test_has_source_list_filter(self):
+        self.customer_ii.default_source = None
+        self.customer_ii.save()
+
+        for value, expected in (
+            ("yes", [self.customer]),
+            ("no", [self.customer_ii]),
+        ):
+            list_filter = CustomerHasSourceListFilter(
+                self.request, {"has_source": value}, Customer, self.model_admin
+            )
+            self.assertEqual(
+                list(list_filter.queryset(self.request, Customer.objects.all())),
+                expected,
+            )
+
+    def test_has_source_list_filter_query(self):
+        """
+        Check the has-source filters test the (indexed) foreign key column
+        directly, rather than joining the payment methods table.
+        """
+        for list_filter_class, model, column in (
+            (CustomerHasSourceListFilter, Customer, "default_source_id"),
+            (InvoiceCustomerHasSourceListFilter, Invoice, "default_source_id"),
+        ):
+            model_admin = admin.site._registry[model]
+            for value, predicate in (("yes", "IS NOT NULL"), ("no", "IS NULL")):
+                list_filter = list_filter_class(
+                    self.request, {"has_source": value}, model, model_admin
+                )
+                query = str(
+                    list_filter.queryset(self.request, model.objects.all()).query
+                )
+                self.assertIn(
+                    "{} {}".format(connection.ops.quote_name(column), predicate), query
+                )
+                self.assertNotIn(DjstripePaymentMethod._meta.db_table, query)
+
+    def test_combined_list_filters_query(self):
+        """
+        Check that combining the has-source and subscription status filters
+        yields a single query with no DISTINCT or join on subscriptions.
+        """
+        self.customer_ii.default_source = None
+        self.customer_ii.save()
+
+        queryset = Customer.objects.all()
+        for list_filter_class, params in (
+            (CustomerHasSourceListFilter, {"has_source": "no"}),
+            (CustomerSubscriptionStatusListFilter, {"sub_status": "none"}),
+        ):
+            list_filter = list_filter_class(
+                self.request, params, Customer, self.model_admin
+            )
+            queryset = list_filter.queryset(self.request, queryset)
+
+        query = str(queryset.query)
+        self.assertNotIn("_has_subscription", query)
+        self.assertNotIn("DISTINCT", query)
+        self.assertNotIn("JOIN", query)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(list(queryset), [self.customer_ii])
+
+
+class TestSubscriptionAdmin(ModelAdminTestCase):
+    model = Subscription
+
+    @patch.object(Subscription, "cancel", autospec=True)
+    def test_cancel_action(self, subscription_cancel_mock):
+        self.model_admin._cancel(self.request, Subscription.objects.all())
+        subscription_cancel_mock.assert_called_once_with(self.subscription)
+
+    @patch.object(Subscription, "cancel", autospec=True)
+    def test_cancel_action_skips_ended_subscriptions(self, subscription_cancel_mock):
+        Subscription.objects.update(status=SubscriptionStatus.canceled)
+
+        with patch.object(self.model_admin, "message_user") as message_user_mock:
+            self.model_admin._cancel(self.request, Subscription.objects.all())
+
+        subscription_cancel_mock.assert_not_called()
+        message_user_mock.assert_called_once_with(
+            self.request,
+            "Skipped ended subscription {}".format(Subscription.objects.get()),
+        )
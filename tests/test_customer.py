@@ -1558,6 +1558,9 @@ class TestCustomer(AssertStripeFksMixin, TestCase):
 
         self.assertEqual(fake_subscriptions[0]["id"], self.customer.subscription.id)
 
+        with self.assertNumQueries(1):
+            self.customer.subscription
+
     @patch(
         "djstripe.models.InvoiceItem.sync_from_stripe_data",
         return_value="pancakes",
@@ -2,14 +2,16 @@
 dj-stripe Event Model Tests.
 """
 from copy import deepcopy
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from django.contrib.auth import get_user_model
+from django.dispatch import Signal
 from django.test import TestCase
 from stripe.error import StripeError
 
 from djstripe import webhooks
 from djstripe.models import Event, Transfer
+from djstripe.signals import WEBHOOK_EVENT_TYPES, WEBHOOK_SIGNALS
 
 from . import FAKE_CUSTOMER, FAKE_EVENT_TRANSFER_CREATED, FAKE_TRANSFER
 
@@ -53,6 +55,33 @@ class EventTest(TestCase):
         event.valid = False
         event.invoke_webhook_handlers()
 
+    def test_invoke_webhook_handlers_sends_signal(self):
+        event = self._create_event(FAKE_EVENT_TRANSFER_CREATED)
+        receiver = Mock()
+        signal = WEBHOOK_SIGNALS[event.type]
+        signal.connect(receiver)
+        self.addCleanup(signal.disconnect, receiver)
+
+        event.invoke_webhook_handlers()
+
+        receiver.assert_called_once_with(signal=signal, sender=Event, event=event)
+
+    def test_webhook_signals_known_type(self):
+        self.assertIn("charge.succeeded", WEBHOOK_SIGNALS)
+        self.assertIsInstance(WEBHOOK_SIGNALS.get("charge.succeeded"), Signal)
+        self.assertIs(
+            WEBHOOK_SIGNALS.get("charge.succeeded"), WEBHOOK_SIGNALS["charge.succeeded"]
+        )
+        self.assertEqual(list(WEBHOOK_SIGNALS), list(WEBHOOK_EVENT_TYPES))
+        self.assertEqual(len(WEBHOOK_SIGNALS), len(WEBHOOK_EVENT_TYPES))
+
+    def test_webhook_signals_unknown_type(self):
+        with self.assertRaises(KeyError):
+            WEBHOOK_SIGNALS["not.an.event"]
+
+        self.assertNotIn("not.an.event", WEBHOOK_SIGNALS)
+        self.assertIsNone(WEBHOOK_SIGNALS.get("not.an.event"))
+
     @patch(target="djstripe.models.core.transaction.atomic", autospec=True)
     @patch.object(target=Event, attribute="_create_from_stripe_object", autospec=True)
     @patch.object(target=Event, attribute="objects", autospec=True)